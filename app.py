@@ -6,19 +6,18 @@ business_metrics.py for all computations and Plotly for all charts.
 No raw Pandas cleaning logic is present in this file.
 """
 
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from data_loader import load_sales_data
+from data_loader import SalesIndex, load_sales_data
 from business_metrics import (
     get_aov,
     get_avg_delivery_time,
     get_avg_monthly_growth,
     get_avg_review_score,
     get_delivery_experience,
-    get_monthly_revenue,
+    get_monthly_revenue_pair,
     get_revenue_by_category,
     get_revenue_by_state,
     get_total_orders,
@@ -41,22 +40,41 @@ st.set_page_config(
 # ---------------------------------------------------------------------------
 
 
-@st.cache_data
-def load_data() -> pd.DataFrame:
-    """Load and cache the full sales DataFrame."""
+@st.cache_resource
+def load_data() -> SalesIndex:
+    """Load the indexed sales data once and share it across sessions."""
     return load_sales_data()
 
 
-sales = load_data()
-available_years = sorted(
-    sales["year"].dropna().unique().astype(int), reverse=True
-)
+@st.cache_data(hash_funcs={SalesIndex: id})
+def precompute_year_metrics(sales: SalesIndex, year: int) -> dict:
+    """Compute and cache every KPI and chart aggregate for a single year."""
+    return {
+        "rev": get_total_revenue(sales, year),
+        "growth": get_avg_monthly_growth(sales, year),
+        "aov": get_aov(sales, year),
+        "orders": get_total_orders(sales, year),
+        "categories": get_revenue_by_category(sales, year, top_n=10),
+        "states": get_revenue_by_state(sales, year),
+        "experience": get_delivery_experience(sales, year),
+        "delivery": get_avg_delivery_time(sales, year),
+        "score": get_avg_review_score(sales, year),
+    }
+
+
 _DEFAULT_YEAR = 2023
-_default_year_index = (
-    available_years.index(_DEFAULT_YEAR)
-    if _DEFAULT_YEAR in available_years
-    else 0
-)
+
+
+@st.cache_data(hash_funcs={SalesIndex: id})
+def compute_year_options(sales: SalesIndex) -> tuple:
+    """Return the selectable years (newest first) and the default's index."""
+    years = sorted(sales.year_bounds, reverse=True)
+    default_index = years.index(_DEFAULT_YEAR) if _DEFAULT_YEAR in years else 0
+    return years, default_index
+
+
+sales = load_data()
+available_years, _default_year_index = compute_year_options(sales)
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -119,20 +137,23 @@ comparison_year = selected_year - 1
 # Compute KPIs
 # ---------------------------------------------------------------------------
 
-rev_curr = get_total_revenue(sales, selected_year)
-rev_prev = get_total_revenue(sales, comparison_year)
+m = precompute_year_metrics(sales, selected_year)
+p = precompute_year_metrics(sales, comparison_year)
+
+rev_curr = m["rev"]
+rev_prev = p["rev"]
 rev_delta = pct_delta(rev_curr, rev_prev)
 
-growth_curr = get_avg_monthly_growth(sales, selected_year) * 100
-growth_prev = get_avg_monthly_growth(sales, comparison_year) * 100
+growth_curr = m["growth"] * 100
+growth_prev = p["growth"] * 100
 growth_delta = round(growth_curr - growth_prev, 2)
 
-aov_curr = get_aov(sales, selected_year)
-aov_prev = get_aov(sales, comparison_year)
+aov_curr = m["aov"]
+aov_prev = p["aov"]
 aov_delta = pct_delta(aov_curr, aov_prev)
 
-orders_curr = get_total_orders(sales, selected_year)
-orders_prev = get_total_orders(sales, comparison_year)
+orders_curr = m["orders"]
+orders_prev = p["orders"]
 orders_delta = pct_delta(orders_curr, orders_prev)
 
 # ---------------------------------------------------------------------------
@@ -190,45 +211,41 @@ with k4:
     )
 
 # ---------------------------------------------------------------------------
-# Charts Row 1: Revenue trend and Top 10 categories
+# Figure builders (cached per year and localized labels)
 # ---------------------------------------------------------------------------
 
-st.markdown("---")
-chart_row1_left, chart_row1_right = st.columns(2)
-
-# Revenue trend
-with chart_row1_left:
-    st.subheader(
-        t["revenue_trend_title"].format(year=selected_year, comp=comparison_year)
-    )
 
-    all_months = pd.DataFrame({"month": range(1, 13)})
-    monthly_curr = all_months.merge(
-        get_monthly_revenue(sales, selected_year), on="month", how="left"
-    ).fillna(0)
-    monthly_prev = all_months.merge(
-        get_monthly_revenue(sales, comparison_year), on="month", how="left"
-    ).fillna(0)
-
-    fig_trend = go.Figure()
-    fig_trend.add_trace(go.Scatter(
-        x=t["months"],
-        y=monthly_curr["revenue"],
+@st.cache_data(hash_funcs={SalesIndex: id})
+def build_trend_fig(
+    sales: SalesIndex,
+    year: int,
+    comp: int,
+    month_labels: tuple,
+    month_axis: str,
+    revenue_axis: str,
+) -> go.Figure:
+    """Build the monthly revenue trend chart for two years."""
+    monthly = get_monthly_revenue_pair(sales, year, comp)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=list(month_labels),
+        y=monthly[year],
         mode="lines+markers",
-        name=str(selected_year),
+        name=str(year),
         line=dict(color="#1f77b4", width=2),
     ))
-    fig_trend.add_trace(go.Scatter(
-        x=t["months"],
-        y=monthly_prev["revenue"],
+    fig.add_trace(go.Scatter(
+        x=list(month_labels),
+        y=monthly[comp],
         mode="lines+markers",
-        name=str(comparison_year),
+        name=str(comp),
         line=dict(color="#aec7e8", width=2, dash="dash"),
     ))
-    fig_trend.update_layout(
+    fig.update_layout(
         yaxis_tickformat="$,.0f",
-        xaxis_title=t["month_axis"],
-        yaxis_title=t["revenue_axis"],
+        xaxis_title=month_axis,
+        yaxis_title=revenue_axis,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         margin=dict(t=10, b=40),
         height=350,
@@ -242,13 +259,13 @@ with chart_row1_left:
             spikedash="dash",
         ),
     )
-    st.plotly_chart(fig_trend, use_container_width=True)
+    return fig
 
-# Top 10 categories
-with chart_row1_right:
-    st.subheader(t["top_categories_title"].format(year=selected_year))
 
-    categories = get_revenue_by_category(sales, selected_year, top_n=10)
+@st.cache_data(hash_funcs={SalesIndex: id})
+def build_category_fig(sales: SalesIndex, year: int, revenue_axis: str) -> go.Figure:
+    """Build the top 10 categories horizontal bar chart."""
+    categories = precompute_year_metrics(sales, year)["categories"]
     categories_asc = categories.sort_values("revenue", ascending=True)
 
     n = len(categories_asc)
@@ -256,72 +273,122 @@ with chart_row1_right:
     color_idx = [int(i * (len(color_scale) - 1) / max(n - 1, 1)) for i in range(n)]
     bar_colors = [color_scale[i] for i in color_idx]
 
-    fig_cat = go.Figure(go.Bar(
+    fig = go.Figure(go.Bar(
         x=categories_asc["revenue"],
         y=categories_asc["product_category_name"],
         orientation="h",
         marker_color=bar_colors,
     ))
-    fig_cat.update_layout(
+    fig.update_layout(
         xaxis_tickformat="$,.0f",
-        xaxis_title=t["revenue_axis"],
+        xaxis_title=revenue_axis,
         margin=dict(t=10, b=40, l=160),
         height=350,
     )
-    st.plotly_chart(fig_cat, use_container_width=True)
+    return fig
 
-# ---------------------------------------------------------------------------
-# Charts Row 2: Geographic distribution and Delivery experience
-# ---------------------------------------------------------------------------
-
-chart_row2_left, chart_row2_right = st.columns(2)
-
-# Geographic distribution
-with chart_row2_left:
-    st.subheader(t["revenue_by_state_title"].format(year=selected_year))
 
-    state_revenue = get_revenue_by_state(sales, selected_year)
+@st.cache_data(hash_funcs={SalesIndex: id})
+def build_state_fig(
+    sales: SalesIndex, year: int, revenue_axis: str, state_label: str
+) -> go.Figure:
+    """Build the revenue-by-state choropleth map."""
+    state_revenue = precompute_year_metrics(sales, year)["states"]
 
-    fig_map = px.choropleth(
+    fig = px.choropleth(
         state_revenue,
         locations="customer_state",
         color="revenue",
         locationmode="USA-states",
         scope="usa",
         color_continuous_scale="Blues",
-        labels={"revenue": t["revenue_axis"], "customer_state": t["state_label"]},
+        labels={"revenue": revenue_axis, "customer_state": state_label},
     )
-    fig_map.update_layout(
+    fig.update_layout(
         coloraxis_colorbar=dict(tickformat="$,.0f"),
         margin=dict(t=10, b=10, l=0, r=0),
         height=350,
     )
-    st.plotly_chart(fig_map, use_container_width=True)
-
-# Delivery experience
-with chart_row2_right:
-    st.subheader(t["delivery_exp_title"].format(year=selected_year))
-
-    experience = get_delivery_experience(sales, selected_year)
-    experience = experience.copy()
-    experience["delivery_time"] = experience["delivery_time"].map(
-        t["delivery_buckets"]
-    )
-
-    fig_exp = go.Figure(go.Bar(
-        x=experience["delivery_time"],
+    return fig
+
+
+@st.cache_data(hash_funcs={SalesIndex: id})
+def build_experience_fig(
+    sales: SalesIndex,
+    year: int,
+    bucket_labels: tuple,
+    delivery_time_axis: str,
+    avg_review_score_axis: str,
+) -> go.Figure:
+    """Build the delivery time vs average review score bar chart."""
+    experience = precompute_year_metrics(sales, year)["experience"]
+    delivery_time = [bucket_labels[i] for i in experience["delivery_time_code"]]
+
+    fig = go.Figure(go.Bar(
+        x=delivery_time,
         y=experience["avg_review_score"].round(2),
         marker_color=["#1f77b4", "#4e9fd4", "#aec7e8"],
         text=experience["avg_review_score"].round(2),
         textposition="outside",
     ))
-    fig_exp.update_layout(
-        xaxis_title=t["delivery_time_axis"],
-        yaxis=dict(range=[0, 5], title=t["avg_review_score_axis"]),
+    fig.update_layout(
+        xaxis_title=delivery_time_axis,
+        yaxis=dict(range=[0, 5], title=avg_review_score_axis),
         margin=dict(t=10, b=40),
         height=350,
     )
-    st.plotly_chart(fig_exp, use_container_width=True)
+    return fig
+
+
+# ---------------------------------------------------------------------------
+# Charts (rendered as a fragment so they can rerun independently)
+# ---------------------------------------------------------------------------
+
+
+@st.fragment
+def render_charts(sales: SalesIndex, year: int, comp: int, t: dict) -> None:
+    """Render the revenue, category, geography and delivery charts."""
+    # Row 1: Revenue trend and Top 10 categories
+    st.markdown("---")
+    chart_row1_left, chart_row1_right = st.columns(2)
+
+    # Revenue trend
+    with chart_row1_left:
+        st.subheader(t["revenue_trend_title"].format(year=year, comp=comp))
+        fig_trend = build_trend_fig(
+            sales, year, comp, tuple(t["months"]), t["month_axis"], t["revenue_axis"]
+        )
+        st.plotly_chart(fig_trend, use_container_width=True, key="trend")
+
+    # Top 10 categories
+    with chart_row1_right:
+        st.subheader(t["top_categories_title"].format(year=year))
+        fig_cat = build_category_fig(sales, year, t["revenue_axis"])
+        st.plotly_chart(fig_cat, use_container_width=True, key="cat")
+
+    # Row 2: Geographic distribution and Delivery experience
+    chart_row2_left, chart_row2_right = st.columns(2)
+
+    # Geographic distribution
+    with chart_row2_left:
+        st.subheader(t["revenue_by_state_title"].format(year=year))
+        fig_map = build_state_fig(sales, year, t["revenue_axis"], t["state_label"])
+        st.plotly_chart(fig_map, use_container_width=True, key="map")
+
+    # Delivery experience
+    with chart_row2_right:
+        st.subheader(t["delivery_exp_title"].format(year=year))
+        fig_exp = build_experience_fig(
+            sales,
+            year,
+            tuple(t["delivery_buckets_ordered"]),
+            t["delivery_time_axis"],
+            t["avg_review_score_axis"],
+        )
+        st.plotly_chart(fig_exp, use_container_width=True, key="exp")
+
+
+render_charts(sales, selected_year, comparison_year, t)
 
 # ---------------------------------------------------------------------------
 # Bottom Row: Delivery time and Review score cards
@@ -330,12 +397,12 @@ with chart_row2_right:
 st.markdown("---")
 b1, b2, b3 = st.columns([1, 1, 2])
 
-avg_delivery_curr = get_avg_delivery_time(sales, selected_year)
-avg_delivery_prev = get_avg_delivery_time(sales, comparison_year)
+avg_delivery_curr = m["delivery"]
+avg_delivery_prev = p["delivery"]
 delivery_delta = round(avg_delivery_curr - avg_delivery_prev, 2)
 
-avg_score_curr = get_avg_review_score(sales, selected_year)
-avg_score_prev = get_avg_review_score(sales, comparison_year)
+avg_score_curr = m["score"]
+avg_score_prev = p["score"]
 score_delta = round(avg_score_curr - avg_score_prev, 2)
 
 with b1:
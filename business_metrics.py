@@ -1,30 +1,116 @@
 """
 Business metrics module for e-commerce analytics.
 
-All public functions accept a sales DataFrame (output of
+All public functions accept indexed sales data (output of
 data_loader.load_sales_data) plus year and optional month parameters,
 and return scalar values or DataFrames for downstream use.
 No raw data loading or Pandas cleaning logic lives here.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
+from data_loader import SalesIndex
+from metrics_numba import NUMBA_AVAILABLE, bucket_mean, monthly_sum
+
+_DELIVERY_BINS = [-np.inf, 3, 7, np.inf]
+_DELIVERY_LABELS = ["1-3 days", "4-7 days", "8+ days"]
+_DELIVERY_DTYPE = pd.CategoricalDtype(_DELIVERY_LABELS, ordered=True)
+
 
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
 
+def _select(
+    by_year: Dict[int, pd.DataFrame],
+    full: pd.DataFrame,
+    year: int,
+    month: Optional[int] = None,
+) -> pd.DataFrame:
+    """Return the year partition, narrowed to the optional month."""
+    df = by_year.get(year, full.iloc[:0])
+    return df if month is None else df[df["month"] == month]
+
+
 def _filter(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
+) -> pd.DataFrame:
+    """Return item rows matching the requested year and optional month."""
+    return _select(sales.by_year, sales.full, year, month)
+
+
+def _filter_orders(
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> pd.DataFrame:
-    """Return rows matching the requested year and optional month."""
-    mask = sales["year"] == year
-    if month is not None:
-        mask &= sales["month"] == month
-    return sales[mask]
+    """Return order-level rows matching the requested year and optional month."""
+    return _select(sales.orders_by_year, sales.orders, year, month)
+
+
+def _numba_ready(*arrays: np.ndarray) -> bool:
+    """Return True if the Numba kernels can run directly on these arrays."""
+    return NUMBA_AVAILABLE and all(
+        isinstance(arr, np.ndarray) and arr.flags["C_CONTIGUOUS"]
+        for arr in arrays
+    )
+
+
+def _sum_price(subset: pd.DataFrame, *keys: str) -> pd.Series:
+    """Sum item prices per group of ``keys``."""
+    by = [subset[key] for key in keys] if len(keys) > 1 else subset[keys[0]]
+    return subset["price"].groupby(by, observed=True, sort=False).sum()
+
+
+def _sum_by_month(subset: pd.DataFrame) -> pd.Series:
+    """Return price totals indexed by the months present, in calendar order."""
+    price = subset["price"].to_numpy()
+    month = subset["month"].to_numpy()
+    if not _numba_ready(price, month):
+        return _sum_price(subset, "month")
+
+    sums = np.zeros(12)
+    counts = np.zeros(12, dtype=np.int64)
+    monthly_sum(price, month, sums, counts)
+    present = np.flatnonzero(counts)
+    index = pd.Index((present + 1).astype(month.dtype), name="month")
+    return pd.Series(sums[present], index=index, name="price")
+
+
+def _mean_review_by_bucket(orders: pd.DataFrame) -> pd.Series:
+    """Return mean review score indexed by ordered delivery bucket."""
+    days = orders["delivery_days"].to_numpy()
+    score = orders["review_score"].to_numpy()
+    if not (_numba_ready(days, score) and np.issubdtype(days.dtype, np.integer)):
+        # Same buckets as categorize_delivery_speed
+        delivery_time = pd.cut(
+            days,
+            bins=_DELIVERY_BINS,
+            labels=_DELIVERY_LABELS,
+            ordered=True,
+        )
+        return (
+            orders["review_score"]
+            .groupby(delivery_time, observed=True, sort=False)
+            .mean()
+            .dropna()
+            .sort_index()
+            .rename_axis("delivery_time")
+        )
+
+    # Inner bin edges; side="left" keeps each edge in the lower bucket
+    bucket = np.searchsorted(_DELIVERY_BINS[1:-1], days, side="left")
+    sums = np.zeros(len(_DELIVERY_LABELS))
+    counts = np.zeros(len(_DELIVERY_LABELS), dtype=np.int64)
+    bucket_mean(score, bucket, sums, counts)
+    present = np.flatnonzero(counts)
+    index = pd.CategoricalIndex(
+        pd.Categorical.from_codes(present, dtype=_DELIVERY_DTYPE),
+        name="delivery_time",
+    )
+    return pd.Series(sums[present] / counts[present], index=index, name="review_score")
 
 
 # ---------------------------------------------------------------------------
@@ -59,15 +145,15 @@ def categorize_delivery_speed(days: float) -> str:
 
 
 def get_total_revenue(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> float:
     """
     Calculate total revenue for the given period.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame from data_loader.
+    sales : SalesIndex
+        Indexed sales data from data_loader.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -81,40 +167,74 @@ def get_total_revenue(
     return float(_filter(sales, year, month)["price"].sum())
 
 
-def get_monthly_revenue(sales: pd.DataFrame, year: int) -> pd.DataFrame:
+def get_monthly_revenue(sales: SalesIndex, year: int) -> pd.DataFrame:
     """
     Aggregate revenue by month for the given year.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
 
     Returns
     -------
     pd.DataFrame
-        DataFrame with columns ['month', 'revenue'].
+        DataFrame indexed by month with a single 'revenue' column; only
+        months with sales are present (use ``.reindex(range(1, 13),
+        fill_value=0)`` for a full calendar).
+    """
+    return _sum_by_month(_filter(sales, year)).to_frame("revenue")
+
+
+def get_monthly_revenue_pair(
+    sales: SalesIndex, year: int, comparison_year: int
+) -> pd.DataFrame:
     """
+    Aggregate revenue by month for two years in a single pass.
+
+    Parameters
+    ----------
+    sales : SalesIndex
+        Indexed sales data.
+    year : int
+        Primary calendar year.
+    comparison_year : int
+        Calendar year to compare against.
+
+    Returns
+    -------
+    pd.DataFrame
+        Indexed by month (1-12) with one revenue column per year, in the
+        order ``[year, comparison_year]``; months without sales are 0.
+    """
+    # Rows are sorted by year, so one positional slice spans both years
+    bounds = [
+        sales.year_bounds[y]
+        for y in (year, comparison_year)
+        if y in sales.year_bounds
+    ]
+    start = min((lo for lo, _ in bounds), default=0)
+    stop = max((hi for _, hi in bounds), default=0)
     result = (
-        _filter(sales, year)
-        .groupby("month")["price"]
-        .sum()
-        .reset_index()
-        .rename(columns={"price": "revenue"})
+        _sum_price(sales.full.iloc[start:stop], "year", "month")
+        .unstack("year")
+        .reindex(index=range(1, 13), columns=[year, comparison_year])
+        .fillna(0)
     )
+    result.index.name = "month"
     return result
 
 
-def get_monthly_growth_rate(sales: pd.DataFrame, year: int) -> pd.Series:
+def get_monthly_growth_rate(sales: SalesIndex, year: int) -> pd.Series:
     """
     Compute month-over-month revenue growth rates within the given year.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
 
@@ -123,18 +243,18 @@ def get_monthly_growth_rate(sales: pd.DataFrame, year: int) -> pd.Series:
     pd.Series
         Indexed by month; the first month will be NaN.
     """
-    monthly = _filter(sales, year).groupby("month")["price"].sum()
+    monthly = _sum_by_month(_filter(sales, year))
     return monthly.pct_change()
 
 
-def get_avg_monthly_growth(sales: pd.DataFrame, year: int) -> float:
+def get_avg_monthly_growth(sales: SalesIndex, year: int) -> float:
     """
     Return the mean of the month-over-month growth rates for the given year.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
 
@@ -154,15 +274,15 @@ def get_avg_monthly_growth(sales: pd.DataFrame, year: int) -> float:
 
 
 def get_total_orders(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> int:
     """
     Count distinct delivered orders for the given period.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -173,19 +293,19 @@ def get_total_orders(
     int
         Number of unique order IDs.
     """
-    return int(_filter(sales, year, month)["order_id"].nunique())
+    return int(len(_filter_orders(sales, year, month)))
 
 
 def get_aov(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> float:
     """
     Compute the average order value (total revenue divided by order count).
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -196,10 +316,12 @@ def get_aov(
     float
         Average order value in currency units.
     """
-    subset = _filter(sales, year, month)
-    per_order = subset.groupby("order_id")["price"].sum()
-    mean_val = per_order.mean()
-    return float(mean_val) if not pd.isna(mean_val) else 0.0
+    # Mean of per-order totals == total revenue / order count, and the
+    # order-level frame already holds one row per order
+    order_count = get_total_orders(sales, year, month)
+    if order_count == 0:
+        return 0.0
+    return get_total_revenue(sales, year, month) / order_count
 
 
 # ---------------------------------------------------------------------------
@@ -208,7 +330,7 @@ def get_aov(
 
 
 def get_revenue_by_category(
-    sales: pd.DataFrame,
+    sales: SalesIndex,
     year: int,
     month: Optional[int] = None,
     top_n: int = 10,
@@ -218,8 +340,8 @@ def get_revenue_by_category(
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -233,9 +355,7 @@ def get_revenue_by_category(
         DataFrame with columns ['product_category_name', 'revenue'].
     """
     result = (
-        _filter(sales, year, month)
-        .groupby("product_category_name")["price"]
-        .sum()
+        _sum_price(_filter(sales, year, month), "product_category_name")
         .sort_values(ascending=False)
         .head(top_n)
         .reset_index()
@@ -245,15 +365,15 @@ def get_revenue_by_category(
 
 
 def get_revenue_by_state(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Aggregate revenue by US state abbreviation.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -265,9 +385,7 @@ def get_revenue_by_state(
         DataFrame with columns ['customer_state', 'revenue'].
     """
     result = (
-        _filter(sales, year, month)
-        .groupby("customer_state")["price"]
-        .sum()
+        _sum_price(_filter(sales, year, month), "customer_state")
         .reset_index()
         .rename(columns={"price": "revenue"})
     )
@@ -280,7 +398,7 @@ def get_revenue_by_state(
 
 
 def get_delivery_experience(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Compute average review score per delivery time bucket.
@@ -289,8 +407,8 @@ def get_delivery_experience(
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame (must contain delivery_days and review_score).
+    sales : SalesIndex
+        Indexed sales data (must contain delivery_days and review_score).
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -299,44 +417,30 @@ def get_delivery_experience(
     Returns
     -------
     pd.DataFrame
-        DataFrame with columns ['delivery_time', 'avg_review_score'],
-        sorted by delivery time bucket order.
+        DataFrame with columns ['delivery_time', 'avg_review_score',
+        'delivery_time_code'], sorted by delivery time bucket order.
+        delivery_time is an ordered categorical; delivery_time_code is
+        its bucket position (0, 1 or 2).
     """
-    subset = (
-        _filter(sales, year, month)[["order_id", "delivery_days", "review_score"]]
-        .drop_duplicates("order_id")
-        .dropna(subset=["delivery_days", "review_score"])
-        .copy()
-    )
-    subset["delivery_time"] = subset["delivery_days"].apply(categorize_delivery_speed)
-
     result = (
-        subset.groupby("delivery_time")["review_score"]
-        .mean()
+        _mean_review_by_bucket(_filter_orders(sales, year, month))
         .reset_index()
         .rename(columns={"review_score": "avg_review_score"})
     )
-
-    bucket_order = {"1-3 days": 0, "4-7 days": 1, "8+ days": 2}
-    result["_sort"] = result["delivery_time"].map(bucket_order)
-    result = (
-        result.sort_values("_sort")
-        .drop(columns="_sort")
-        .reset_index(drop=True)
-    )
+    result["delivery_time_code"] = result["delivery_time"].cat.codes
     return result
 
 
 def get_avg_delivery_time(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> float:
     """
     Return mean delivery duration in calendar days.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -347,25 +451,20 @@ def get_avg_delivery_time(
     float
         Average delivery time in days.
     """
-    subset = (
-        _filter(sales, year, month)[["order_id", "delivery_days"]]
-        .drop_duplicates("order_id")
-        .dropna()
-    )
-    mean_val = subset["delivery_days"].mean()
+    mean_val = _filter_orders(sales, year, month)["delivery_days"].mean()
     return float(mean_val) if not pd.isna(mean_val) else 0.0
 
 
 def get_avg_review_score(
-    sales: pd.DataFrame, year: int, month: Optional[int] = None
+    sales: SalesIndex, year: int, month: Optional[int] = None
 ) -> float:
     """
     Return mean customer review score on a 1-5 scale.
 
     Parameters
     ----------
-    sales : pd.DataFrame
-        Flat sales DataFrame.
+    sales : SalesIndex
+        Indexed sales data.
     year : int
         Calendar year to filter on.
     month : int, optional
@@ -376,10 +475,5 @@ def get_avg_review_score(
     float
         Average review score.
     """
-    subset = (
-        _filter(sales, year, month)[["order_id", "review_score"]]
-        .drop_duplicates("order_id")
-        .dropna()
-    )
-    mean_val = subset["review_score"].mean()
+    mean_val = _filter_orders(sales, year, month)["review_score"].mean()
     return float(mean_val) if not pd.isna(mean_val) else 0.0
@@ -6,13 +6,20 @@ and multi-table join logic to produce a flat, analysis-ready DataFrame.
 """
 
 import os
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
+from pyarrow import ArrowException
 
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ecommerce_data")
 
+# Joined sales frame cached next to the source CSVs
+_CACHE_FILENAME = ".sales.parquet"
+
 _DATE_COLUMNS = [
     "order_purchase_timestamp",
     "order_approved_at",
@@ -21,11 +28,107 @@ _DATE_COLUMNS = [
     "order_estimated_delivery_date",
 ]
 
+# Source file and the columns consumed downstream for each raw table
+_RAW_FILES = {
+    "orders": (
+        "orders_dataset.csv",
+        [
+            "order_id",
+            "customer_id",
+            "order_status",
+            "order_purchase_timestamp",
+            "order_delivered_customer_date",
+        ],
+    ),
+    "order_items": (
+        "order_items_dataset.csv",
+        ["order_id", "order_item_id", "product_id", "price", "freight_value"],
+    ),
+    "products": (
+        "products_dataset.csv",
+        ["product_id", "product_category_name"],
+    ),
+    "customers": (
+        "customers_dataset.csv",
+        ["customer_id", "customer_state"],
+    ),
+    "reviews": (
+        "order_reviews_dataset.csv",
+        ["order_id", "review_score"],
+    ),
+    "payments": (
+        "order_payments_dataset.csv",
+        ["order_id", "payment_value"],
+    ),
+}
+
+_CATEGORICAL_COLUMNS = [
+    "order_status",
+    "product_category_name",
+    "customer_state",
+]
+
+_NUMERIC_DTYPES = {
+    "year": "int16",
+    "month": "int8",
+    "delivery_days": "int16",
+}
+
+_ORDER_LEVEL_COLUMNS = [
+    "order_id",
+    "year",
+    "month",
+    "delivery_days",
+    "review_score",
+]
+
+
+@dataclass
+class SalesIndex:
+    """
+    Flat sales DataFrame together with its per-year partitions.
+
+    Attributes
+    ----------
+    full : pd.DataFrame
+        Flat sales DataFrame (output of build_sales_data), sorted by year
+        and month.
+    year_bounds : dict[int, tuple[int, int]]
+        ``(start, stop)`` row positions of each calendar year in ``full``.
+    by_year : dict[int, pd.DataFrame]
+        Rows of ``full`` split by calendar year (positional slices).
+    orders : pd.DataFrame
+        One row per order with the order-level columns of ``full``.
+    orders_by_year : dict[int, pd.DataFrame]
+        Rows of ``orders`` split by calendar year.
+    """
+
+    full: pd.DataFrame
+    year_bounds: Dict[int, Tuple[int, int]]
+    by_year: Dict[int, pd.DataFrame]
+    orders: pd.DataFrame
+    orders_by_year: Dict[int, pd.DataFrame]
+
+
+def _read_csv(path: str, usecols: List[str]) -> pd.DataFrame:
+    """Read a CSV with the PyArrow engine, parsing any known date columns."""
+    parse_dates = [col for col in _DATE_COLUMNS if col in usecols]
+    return pd.read_csv(
+        path,
+        engine="pyarrow",
+        usecols=usecols,
+        parse_dates=parse_dates or None,
+    )
+
 
 def load_raw_data(data_dir: str = DATA_DIR) -> Dict[str, pd.DataFrame]:
     """
     Load all six CSV datasets from the specified directory.
 
+    Only the columns consumed by build_sales_data are read from each file
+    (the payments table keeps just order_id and payment_value), and the
+    files are read in parallel threads.
+
     Parameters
     ----------
     data_dir : str
@@ -37,28 +140,21 @@ def load_raw_data(data_dir: str = DATA_DIR) -> Dict[str, pd.DataFrame]:
         Dictionary with keys: orders, order_items, products,
         customers, reviews, payments.
     """
-    return {
-        "orders": pd.read_csv(os.path.join(data_dir, "orders_dataset.csv")),
-        "order_items": pd.read_csv(
-            os.path.join(data_dir, "order_items_dataset.csv")
-        ),
-        "products": pd.read_csv(os.path.join(data_dir, "products_dataset.csv")),
-        "customers": pd.read_csv(
-            os.path.join(data_dir, "customers_dataset.csv")
-        ),
-        "reviews": pd.read_csv(
-            os.path.join(data_dir, "order_reviews_dataset.csv")
-        ),
-        "payments": pd.read_csv(
-            os.path.join(data_dir, "order_payments_dataset.csv")
-        ),
-    }
+    # Files are read concurrently; CSV parsing releases the GIL
+    with ThreadPoolExecutor(max_workers=len(_RAW_FILES)) as pool:
+        futures = {
+            name: pool.submit(_read_csv, os.path.join(data_dir, filename), usecols)
+            for name, (filename, usecols) in _RAW_FILES.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
 
 
 def preprocess_orders(orders: pd.DataFrame) -> pd.DataFrame:
     """
     Convert all timestamp columns to datetime and derive year/month columns.
 
+    Columns already parsed at read time are left untouched.
+
     Parameters
     ----------
     orders : pd.DataFrame
@@ -71,7 +167,7 @@ def preprocess_orders(orders: pd.DataFrame) -> pd.DataFrame:
     """
     df = orders.copy()
     for col in _DATE_COLUMNS:
-        if col in df.columns:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
             df[col] = pd.to_datetime(df[col], errors="coerce")
     df["year"] = df["order_purchase_timestamp"].dt.year
     df["month"] = df["order_purchase_timestamp"].dt.month
@@ -138,33 +234,121 @@ def build_sales_data(
     ).dt.days
     sales = sales[sales["delivery_days"] >= 0]
 
-    # Attach product category
-    sales = sales.merge(
-        products[["product_id", "product_category_name"]],
-        on="product_id",
-        how="left",
+    # Attach product category, customer state and review score (one review
+    # per order) as single-column lookups rather than full merges
+    category_by_product = products.set_index("product_id")["product_category_name"]
+    state_by_customer = customers.set_index("customer_id")["customer_state"]
+    score_by_order = (
+        reviews.drop_duplicates("order_id").set_index("order_id")["review_score"]
     )
-
-    # Attach customer state
-    sales = sales.merge(
-        customers[["customer_id", "customer_state"]],
-        on="customer_id",
-        how="left",
+    sales = sales.assign(
+        product_category_name=sales["product_id"].map(category_by_product),
+        customer_state=sales["customer_id"].map(state_by_customer),
+        review_score=sales["order_id"].map(score_by_order),
     )
 
-    # Attach review score (one review per order)
-    sales = sales.merge(
-        reviews[["order_id", "review_score"]].drop_duplicates("order_id"),
-        on="order_id",
-        how="left",
-    )
+    # Low-cardinality labels: categorical codes make groupby hash integers
+    for col in _CATEGORICAL_COLUMNS:
+        sales[col] = sales[col].astype("category")
+
+    # Narrowest integer dtypes that hold each derived column's range
+    sales = sales.astype(_NUMERIC_DTYPES)
 
+    # Sorted by period so each year is a contiguous block of rows
+    sales = sales.sort_values(["year", "month"], kind="stable")
     return sales.reset_index(drop=True)
 
 
-def load_sales_data(data_dir: str = DATA_DIR) -> pd.DataFrame:
+def _year_bounds(df: pd.DataFrame) -> Dict[int, Tuple[int, int]]:
+    """Return ``{year: (start, stop)}`` row positions of a year-sorted DataFrame."""
+    years = df["year"].to_numpy()
+    unique_years = np.unique(years)
+    starts = np.searchsorted(years, unique_years, side="left")
+    stops = np.searchsorted(years, unique_years, side="right")
+    return {
+        int(year): (int(start), int(stop))
+        for year, start, stop in zip(unique_years, starts, stops)
+    }
+
+
+def _split_by_year(df: pd.DataFrame) -> Dict[int, pd.DataFrame]:
+    """Split a year-sorted DataFrame into ``{year: rows}`` positional slices."""
+    return {
+        year: df.iloc[start:stop]
+        for year, (start, stop) in _year_bounds(df).items()
+    }
+
+
+def index_sales_data(sales: pd.DataFrame) -> SalesIndex:
+    """
+    Partition the flat sales DataFrame by year for fast per-period lookups.
+
+    Rows are sorted by year and month so that every partition is a
+    contiguous slice of the underlying frame rather than a copy, and
+    month-level groupbys see months in calendar order. An order-level frame (one
+    row per order) is derived once here so that delivery and review
+    metrics do not deduplicate item rows on every call.
+
+    Parameters
+    ----------
+    sales : pd.DataFrame
+        Flat sales DataFrame (output of build_sales_data).
+
+    Returns
+    -------
+    SalesIndex
+        The item-level and order-level frames plus their
+        ``{year: rows}`` dictionaries.
+    """
+    period = sales["year"].astype("int32") * 12 + sales["month"]
+    if not period.is_monotonic_increasing:
+        sales = sales.sort_values(["year", "month"], kind="stable")
+        sales = sales.reset_index(drop=True)
+    orders = sales.drop_duplicates("order_id")[_ORDER_LEVEL_COLUMNS]
+    return SalesIndex(
+        full=sales,
+        year_bounds=_year_bounds(sales),
+        by_year=_split_by_year(sales),
+        orders=orders,
+        orders_by_year=_split_by_year(orders),
+    )
+
+
+def _cache_is_fresh(cache_path: str, data_dir: str) -> bool:
+    """
+    Return True if the cache file exists and is newer than every source CSV
+    and than this module, whose join logic determines the cached frame.
+    """
+    if not os.path.exists(cache_path):
+        return False
+    cache_mtime = os.path.getmtime(cache_path)
+    sources = [
+        os.path.join(data_dir, filename) for filename, _ in _RAW_FILES.values()
+    ]
+    sources.append(os.path.abspath(__file__))
+    return all(os.path.getmtime(path) <= cache_mtime for path in sources)
+
+
+def _write_cache(sales: pd.DataFrame, cache_path: str) -> None:
+    """Write the Parquet cache atomically; skip it if the write fails."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        sales.to_parquet(tmp_path, compression="zstd", index=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only or full data directory: skip caching and rebuild next time
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_sales_data(data_dir: str = DATA_DIR) -> SalesIndex:
     """
-    Convenience wrapper: load raw data and return the fully joined sales DataFrame.
+    Convenience wrapper: load raw data and return the indexed sales data.
+
+    The joined sales frame is cached as Parquet in ``data_dir`` and reused
+    until any source CSV is modified. The cache is written to a temporary
+    file and swapped into place atomically; an unreadable cache is ignored
+    and rebuilt from the CSVs.
 
     Parameters
     ----------
@@ -173,15 +357,26 @@ def load_sales_data(data_dir: str = DATA_DIR) -> pd.DataFrame:
 
     Returns
     -------
-    pd.DataFrame
-        Flat, analysis-ready sales DataFrame.
+    SalesIndex
+        Flat, analysis-ready sales DataFrame (``.full``) and its
+        per-year partitions (``.by_year``).
     """
+    cache_path = os.path.join(data_dir, _CACHE_FILENAME)
+    if _cache_is_fresh(cache_path, data_dir):
+        try:
+            return index_sales_data(pd.read_parquet(cache_path))
+        except (OSError, ValueError, ArrowException):
+            # Truncated or corrupt cache: fall through and rebuild it
+            pass
+
     raw = load_raw_data(data_dir)
     orders = preprocess_orders(raw["orders"])
-    return build_sales_data(
+    sales = build_sales_data(
         orders,
         raw["order_items"],
         raw["customers"],
         raw["products"],
         raw["reviews"],
     )
+    _write_cache(sales, cache_path)
+    return index_sales_data(sales)
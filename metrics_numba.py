@@ -0,0 +1,71 @@
+"""
+Optional Numba kernels for the hottest business metric reductions.
+
+Each kernel accumulates into caller-provided output arrays over flat
+NumPy columns taken from a per-year slice. Numba is not a hard
+dependency: when it is not installed NUMBA_AVAILABLE is False and
+business_metrics falls back to the equivalent pandas groupby.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator that leaves the function uncompiled."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def monthly_sum(price, month, sums, counts):
+    """
+    Accumulate price totals and row counts per calendar month.
+
+    Parameters
+    ----------
+    price : np.ndarray
+        Item prices.
+    month : np.ndarray
+        Calendar month (1-12) of each item.
+    sums : np.ndarray
+        Length-12 float64 output; ``sums[m - 1]`` receives month m's total.
+    counts : np.ndarray
+        Length-12 int64 output; ``counts[m - 1]`` receives month m's rows.
+    """
+    for i in range(price.shape[0]):
+        m = month[i] - 1
+        sums[m] += price[i]
+        counts[m] += 1
+
+
+@njit(cache=True)
+def bucket_mean(score, bucket, sums, counts):
+    """
+    Accumulate review score totals and counts per delivery bucket.
+
+    Rows with a missing (NaN) score are skipped.
+
+    Parameters
+    ----------
+    score : np.ndarray
+        Review score of each order.
+    bucket : np.ndarray
+        Delivery bucket code (0, 1 or 2) of each order.
+    sums : np.ndarray
+        Float64 output, one slot per bucket.
+    counts : np.ndarray
+        Int64 output, one slot per bucket.
+    """
+    for i in range(score.shape[0]):
+        s = score[i]
+        if not np.isnan(s):
+            b = bucket[i]
+            sums[b] += s
+            counts[b] += 1
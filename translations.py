@@ -45,12 +45,8 @@ TRANSLATIONS: Dict[str, Dict[str, Any]] = {
         "score_good": "Good",
         "score_average": "Average",
         "score_below": "Below Average",
-        # Delivery bucket label translation (business_metrics always returns English keys)
-        "delivery_buckets": {
-            "1-3 days": "1-3 days",
-            "4-7 days": "4-7 days",
-            "8+ days":  "8+ days",
-        },
+        # Delivery bucket labels, indexed by business_metrics' delivery_time_code
+        "delivery_buckets_ordered": ["1-3 days", "4-7 days", "8+ days"],
     },
     "zh": {
         # Page and header
@@ -90,11 +86,7 @@ TRANSLATIONS: Dict[str, Dict[str, Any]] = {
         "score_good": "良好",
         "score_average": "一般",
         "score_below": "较差",
-        # Delivery bucket label translation
-        "delivery_buckets": {
-            "1-3 days": "1-3天",
-            "4-7 days": "4-7天",
-            "8+ days":  "8天以上",
-        },
+        # Delivery bucket labels (index = delivery_time_code)
+        "delivery_buckets_ordered": ["1-3天", "4-7天", "8天以上"],
     },
 }